@@ -2,11 +2,30 @@
 
 from __future__ import annotations
 
+import math
+from functools import lru_cache
+
 from flask import Flask
 
 from festival_roi.formatting import format_currency as core_format_currency
 
 
+def currency_filter(value: float, symbol: str = "$") -> str:
+    """Format numeric values as currency for templates.
+
+    Registered directly as the ``currency`` filter; templates pass the
+    configured symbol via the ``DEFAULT_CURRENCY`` global. Memoised because
+    dashboards repeat many figures (totals, zeros).
+    """
+    # -0.0 == 0.0 but formats as "-0.00", so the sign is part of the key.
+    return _format_currency_cached(value, math.copysign(1.0, value), symbol)
+
+
+@lru_cache(maxsize=4096)
+def _format_currency_cached(value: float, sign: float, symbol: str) -> str:
+    return core_format_currency(value, symbol)
+
+
 def create_app() -> Flask:
     """Create and configure the Flask application instance."""
     app = Flask(__name__)
@@ -15,12 +34,8 @@ def create_app() -> Flask:
         ROI_CURRENCY_SYMBOL="$",
     )
 
-    def currency_filter(value: float, symbol: str | None = None) -> str:
-        """Format numeric values as currency for templates."""
-        currency_symbol = symbol or app.config["ROI_CURRENCY_SYMBOL"]
-        return core_format_currency(value, currency_symbol)
-
     app.jinja_env.filters["currency"] = currency_filter
+    app.jinja_env.globals["DEFAULT_CURRENCY"] = app.config["ROI_CURRENCY_SYMBOL"]
 
     # Deferred import so extensions can access the app instance.
     from .routes import dashboard_bp
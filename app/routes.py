@@ -2,38 +2,21 @@
 
 from __future__ import annotations
 
-from flask import Blueprint, current_app, flash, render_template, request
+from functools import lru_cache
+
+from flask import Blueprint, flash, render_template, request
 
 from app.services import (
     analyse_events,
     get_sample_events,
-    load_uploaded_events,
+    load_uploaded_dataset,
 )
 
 dashboard_bp = Blueprint("dashboard", __name__)
 
 
-@dashboard_bp.route("/", methods=["GET", "POST"])
-def home() -> str:
-    """Render the dashboard index page."""
-    events = get_sample_events()
-    dataset_label = "Sample dataset"
-    min_attendance = 0
-    if request.method == "POST":
-        min_attendance = int(request.form.get("min_attendance", 0) or 0)
-        upload = request.files.get("dataset")
-        if upload and upload.filename:
-            try:
-                events = load_uploaded_events(upload)
-                dataset_label = upload.filename
-                flash(f"Loaded {len(events)} events from {upload.filename}", "success")
-            except ValueError as exc:
-                flash(str(exc), "danger")
-                events = get_sample_events()
-                dataset_label = "Sample dataset"
-        else:
-            flash("Using bundled sample dataset", "info")
-    analysis = analyse_events(
+def _analyse(events, min_attendance: int) -> dict:
+    return analyse_events(
         events,
         rank_by="roi",
         top=3,
@@ -41,7 +24,40 @@ def home() -> str:
         roi_target=0.2,
         min_attendance=min_attendance,
     )
-    currency_symbol = current_app.config["ROI_CURRENCY_SYMBOL"]
+
+
+@lru_cache(maxsize=32)
+def _analyse_sample(min_attendance: int) -> dict:
+    """Return the (shared, read-only) analysis of the bundled sample dataset."""
+    return _analyse(get_sample_events(), min_attendance)
+
+
+@dashboard_bp.route("/", methods=["GET"])
+def home() -> str:
+    """Render the dashboard index page for the bundled sample dataset."""
+    return _render(_analyse_sample(0), "Sample dataset", 0)
+
+
+@dashboard_bp.route("/", methods=["POST"])
+def home_post() -> str:
+    """Analyse an uploaded dataset (or the sample) and render the dashboard."""
+    min_attendance = int(request.form.get("min_attendance", 0) or 0)
+    upload = request.files.get("dataset")
+    if upload and upload.filename:
+        try:
+            events, count = load_uploaded_dataset(upload)
+        except ValueError as exc:
+            flash(str(exc), "danger")
+        else:
+            flash(f"Loaded {count} events from {upload.filename}", "success")
+            analysis = _analyse(events, min_attendance)
+            return _render(analysis, upload.filename, min_attendance)
+    else:
+        flash("Using bundled sample dataset", "info")
+    return _render(_analyse_sample(min_attendance), "Sample dataset", min_attendance)
+
+
+def _render(analysis: dict, dataset_label: str, min_attendance: int) -> str:
     return render_template(
         "dashboard.html",
         summary=analysis["summary"],
@@ -49,7 +65,6 @@ def home() -> str:
         bottom_events=analysis["bottom_events"],
         roi_target=analysis["roi_target"],
         underperformers=analysis["underperformers"],
-        currency=currency_symbol,
         chart=analysis["chart"],
         dataset_label=dataset_label,
         min_attendance=min_attendance,
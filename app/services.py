@@ -2,26 +2,48 @@
 
 from __future__ import annotations
 
-import csv
-import io
-from typing import Iterable, List, Optional
+import heapq
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
 
-from werkzeug.datastructures import FileStorage
+from festival_roi._compat import BULK_PARSE_MIN_BYTES, optional_import
 
-from festival_roi.analysis import summarize
-from festival_roi.models import FestivalEvent
-from festival_roi.ranking import metric_value
-from festival_roi.reporting import event_as_dict
-from festival_roi.sample_data import sample_events
+# The core library and upload parsing are imported where used so that loading
+# the blueprint (e.g. for health checks) does not pay for them.
+if TYPE_CHECKING:
+    from werkzeug.datastructures import FileStorage
+
+    from festival_roi.models import FestivalEvent
+
+_SCRIPT_ESCAPES = (
+    ("<", "\\u003c"),
+    (">", "\\u003e"),
+    ("&", "\\u0026"),
+    ("'", "\\u0027"),
+)
 
 
 def get_sample_events() -> List[FestivalEvent]:
-    """Return the demo dataset used when no file is provided."""
+    """Return the demo dataset used when no file is provided.
+
+    The events themselves are built once, in ``festival_roi.sample_data``.
+    """
+    from festival_roi.sample_data import sample_events
+
     return sample_events()
 
 
 def analyse_events(
-    events: Iterable[FestivalEvent],
+    events: Union[Iterable[FestivalEvent], Mapping[str, Any]],
     *,
     rank_by: str = "roi",
     top: int = 3,
@@ -29,33 +51,70 @@ def analyse_events(
     roi_target: Optional[float] = None,
     min_attendance: int = 0,
 ) -> dict:
-    """Compute metrics and breakdowns for the dashboard."""
-    events = list(events)
-    if min_attendance > 0:
-        events = [event for event in events if event.attendance >= min_attendance]
-    summary = summarize(events)
+    """Compute metrics and breakdowns for the dashboard.
+
+    ``events`` may also be the column mapping returned by
+    :func:`load_uploaded_events_arrays`.
+    """
+    from festival_roi.analysis import summarize
+    from festival_roi.ranking import resolve_metric
 
-    ranked_desc: List[FestivalEvent] = []
-    if events:
-        ranked_desc = sorted(
-            events, key=lambda event: metric_value(event, rank_by), reverse=True
+    roi_threshold = roi_target if roi_target is not None else None
+    if isinstance(events, Mapping):
+        return _analyse_columns(
+            events,
+            rank_by=rank_by,
+            top=top,
+            bottom=bottom,
+            roi_threshold=roi_threshold,
+            min_attendance=min_attendance,
         )
+    # One walk filters, collects metrics and underperformers, and fills the
+    # chart series; only the heap selection below revisits the kept events.
+    key = resolve_metric(rank_by)
+    filtering = min_attendance > 0
+    flagging = roi_threshold is not None
+    kept: List[FestivalEvent] = []
+    metrics: List[float] = []
+    underperformers = []
+    labels: List[str] = []
+    roi_values: List[float] = []
+    profit_values: List[float] = []
+    attendance_values: List[int] = []
+    for event in events:
+        if filtering and event.attendance < min_attendance:
+            continue
+        kept.append(event)
+        metrics.append(key(event))
+        labels.append(event.name)
+        roi_values.append(round(event.roi * 100, 2))
+        profit_values.append(event.profit)
+        attendance_values.append(event.attendance)
+        if flagging and event.roi < roi_threshold:
+            underperformers.append(event)
+    events = kept
 
-    top_events = ranked_desc[: max(0, min(top, len(ranked_desc)))]
-    bottom_events: List[FestivalEvent] = []
+    # nlargest/nsmallest with a key match sorted(...)[:n], ties included.
+    positions = range(len(events))
+    top_events = [
+        events[index]
+        for index in heapq.nlargest(max(0, top), positions, key=metrics.__getitem__)
+    ]
+    bottom_events = []
     if bottom > 0:
-        bottom_events = sorted(
-            events, key=lambda event: metric_value(event, rank_by)
-        )[: max(0, min(bottom, len(events)))]
-
-    roi_threshold = roi_target if roi_target is not None else None
-    underperformers: List[FestivalEvent] = []
-    if roi_threshold is not None:
-        underperformers = [
-            event for event in events if event.roi < roi_threshold
+        bottom_events = [
+            events[index]
+            for index in heapq.nsmallest(bottom, positions, key=metrics.__getitem__)
         ]
-
-    chart_payload = _build_chart_payload(events)
+    chart_payload = _with_json(
+        {
+            "labels": labels,
+            "roi": roi_values,
+            "profit": profit_values,
+            "attendance": attendance_values,
+        }
+    )
+    summary = summarize(events)
 
     return {
         "summary": summary,
@@ -67,48 +126,170 @@ def analyse_events(
 }
 
 
-def serialize_events(events: Iterable[FestivalEvent]) -> List[dict]:
-    """Convert event dataclasses into dictionaries for JSON responses."""
-    return [event_as_dict(event) for event in events]
-
+def _analyse_columns(
+    columns: Mapping[str, Any],
+    *,
+    rank_by: str,
+    top: int,
+    bottom: int,
+    roi_threshold: Optional[float],
+    min_attendance: int,
+) -> dict:
+    """Run :func:`analyse_events` on NumPy columns without building every event."""
+    from festival_roi.analysis import column_metrics, summarize_columns
+    from festival_roi.io import events_from_columns
+    from festival_roi.ranking import rank_column_indices
 
-def _build_chart_payload(events: Iterable[FestivalEvent]) -> dict:
-    events = list(events)
-    labels = [event.name for event in events]
-    roi_values = [round(event.roi * 100, 2) for event in events]
-    profit_values = [event.profit for event in events]
-    attendance_values = [event.attendance for event in events]
+    columns = column_metrics(columns, min_attendance)
+    top_indices, bottom_indices, under_indices = rank_column_indices(
+        columns, rank_by, top, bottom, roi_threshold
+    )
     return {
-        "labels": labels,
-        "roi": roi_values,
-        "profit": profit_values,
-        "attendance": attendance_values,
+        # The server is long-lived, so Numba's import is paid once, not per run.
+        "summary": summarize_columns(columns, use_kernel=True),
+        "top_events": events_from_columns(columns, top_indices),
+        "bottom_events": events_from_columns(columns, bottom_indices),
+        "underperformers": events_from_columns(columns, under_indices),
+        "chart": _with_json(
+            {
+                "labels": columns["name"].tolist(),
+                "roi": [round(value * 100, 2) for value in columns["roi"].tolist()],
+                "profit": columns["profit"].tolist(),
+                "attendance": columns["attendance"].tolist(),
+            }
+        ),
+        "roi_target": roi_threshold,
     }
 
 
+def serialize_events(events: Iterable[FestivalEvent]) -> List[dict]:
+    """Convert events into dictionaries for JSON responses."""
+    from festival_roi.reporting import events_as_dicts
+
+    return events_as_dicts(events)
+
+
+def _with_json(payload: dict) -> dict:
+    """Attach the payload's JSON, escaped for inline ``<script>`` use, as ``json``.
+
+    Serialised once here (with orjson when installed) rather than by
+    ``|tojson`` on every render; cached analyses carry the string with them.
+    """
+    text = None
+    orjson = optional_import("orjson")
+    if orjson is not None:
+        try:
+            encoded = orjson.dumps(payload)
+        except orjson.JSONEncodeError:  # e.g. integers wider than 64 bits
+            pass
+        else:
+            # orjson writes NaN and infinities as null; json keeps them.
+            if b"null" not in encoded:
+                text = encoded.decode("utf-8")
+    if text is None:
+        import json
+
+        text = json.dumps(payload, separators=(",", ":"))
+    # Same escaping as Jinja's tojson so event names cannot close the script.
+    for char, escaped in _SCRIPT_ESCAPES:
+        text = text.replace(char, escaped)
+    return {"json": text, **payload}
+
+
 def load_uploaded_events(file_storage: FileStorage) -> List[FestivalEvent]:
     """Parse a CSV upload into FestivalEvent instances."""
+    from festival_roi.models import FestivalEvent
+
+    columns = _try_load_arrays(file_storage)
+    if columns is None:
+        return _parse_upload_rows(file_storage)
+    return [
+        FestivalEvent(name, cost, revenue, attendance)
+        for name, cost, revenue, attendance in zip(
+            columns["name"].tolist(),
+            columns["cost"].tolist(),
+            columns["revenue"].tolist(),
+            columns["attendance"].tolist(),
+        )
+    ]
+
+
+def _parse_upload_rows(file_storage: FileStorage) -> List[FestivalEvent]:
+    """Parse an upload row by row, reporting the first invalid row."""
+    import io
+
+    from festival_roi.io import read_event_rows
+
     if file_storage.filename == "":
         raise ValueError("No file selected")
-    raw = file_storage.read()
-    text_stream = io.StringIO(raw.decode("utf-8"))
-    reader = csv.DictReader(text_stream)
-    required = {"name", "cost", "revenue", "attendance"}
-    missing = required - set(reader.fieldnames or [])
-    if missing:
-        pretty = ", ".join(sorted(missing))
-        raise ValueError(f"CSV missing required columns: {pretty}")
-    events: List[FestivalEvent] = []
-    for row in reader:
-        try:
-            events.append(
-                FestivalEvent(
-                    name=row["name"],
-                    cost=float(row["cost"]),
-                    revenue=float(row["revenue"]),
-                    attendance=int(row["attendance"]),
-                )
-            )
-        except (TypeError, ValueError) as exc:
-            raise ValueError(f"Invalid row {row}") from exc
-    return events
+    # Decode straight off the upload stream instead of buffering the whole file.
+    stream = io.TextIOWrapper(file_storage.stream, encoding="utf-8", newline="")
+    try:
+        return read_event_rows(stream)
+    finally:
+        # Leave the underlying upload stream open for Werkzeug to clean up.
+        stream.detach()
+
+
+def load_uploaded_events_arrays(file_storage: FileStorage) -> Dict[str, Any]:
+    """Parse a CSV upload straight into NumPy columns.
+
+    Returns ``name``, ``cost``, ``revenue`` and ``attendance`` arrays suitable
+    for :func:`analyse_events`. Requires NumPy.
+    """
+    import io
+
+    from festival_roi.io import read_event_columns
+
+    if file_storage.filename == "":
+        raise ValueError("No file selected")
+    stream = io.TextIOWrapper(file_storage.stream, encoding="utf-8", newline="")
+    try:
+        return read_event_columns(stream)
+    finally:
+        stream.detach()
+
+
+def load_uploaded_dataset(
+    file_storage: FileStorage,
+) -> Tuple[Union[List[FestivalEvent], Dict[str, Any]], int]:
+    """Parse an upload for :func:`analyse_events` and return its event count.
+
+    Larger uploads become NumPy columns when NumPy is installed; the rest are
+    parsed into FestivalEvent lists.
+    """
+    columns = _try_load_arrays(file_storage)
+    if columns is not None:
+        return columns, len(columns["name"])
+    events = _parse_upload_rows(file_storage)
+    return events, len(events)
+
+
+def _try_load_arrays(file_storage: FileStorage) -> Optional[Dict[str, Any]]:
+    """Bulk-parse ``file_storage`` with NumPy, or return ``None`` to fall back.
+
+    Clean files of at least ``BULK_PARSE_MIN_BYTES`` parse in one ``loadtxt``
+    call; smaller ones are left to the row parser. On any failure the stream
+    is rewound so the row-by-row parser can produce its precise error message.
+    """
+    if _upload_size(file_storage) < BULK_PARSE_MIN_BYTES:
+        return None  # Small uploads do not pay for importing NumPy.
+    if optional_import("numpy") is None:
+        return None
+    try:
+        return load_uploaded_events_arrays(file_storage)
+    except ValueError:
+        file_storage.stream.seek(0)
+        return None
+
+
+def _upload_size(file_storage: FileStorage) -> int:
+    """Return the upload's size in bytes, or 0 if the stream cannot seek."""
+    stream = file_storage.stream
+    try:
+        position = stream.tell()
+        size = stream.seek(0, 2)
+        stream.seek(position)
+    except (AttributeError, OSError):
+        return 0
+    return size
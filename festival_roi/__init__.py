@@ -1,25 +1,90 @@
 """Core package for festival ROI analysis utilities."""
 
-from .analysis import summarize
-from .cli import main as cli_main, parse_args
-from .formatting import format_currency
-from .io import load_events
-from .models import FestivalEvent
-from .ranking import metric_value
-from .reporting import event_as_dict, export_report
-from .sample_data import sample_events
+from __future__ import annotations
 
-main = cli_main
+import importlib
+from typing import TYPE_CHECKING, Any
+
+# Public names are resolved on first access so importing one submodule (as
+# the dashboard does) does not load the CLI, CSV and JSON machinery as well.
+_EXPORTS = {
+    "FestivalEvent": ("festival_roi.models", "FestivalEvent"),
+    "Summary": ("festival_roi.models", "Summary"),
+    "summarize": ("festival_roi.analysis", "summarize"),
+    "summarize_path": ("festival_roi.analysis", "summarize_path"),
+    "summarize_below_target": ("festival_roi.analysis", "summarize_below_target"),
+    "load_events": ("festival_roi.io", "load_events"),
+    "load_events_arrow": ("festival_roi.io", "load_events_arrow"),
+    "load_events_columnar": ("festival_roi.io", "load_events_columnar"),
+    "load_events_df": ("festival_roi.io", "load_events_df"),
+    "export_report": ("festival_roi.reporting", "export_report"),
+    "event_as_dict": ("festival_roi.reporting", "event_as_dict"),
+    "events_as_dicts": ("festival_roi.reporting", "events_as_dicts"),
+    "sample_events": ("festival_roi.sample_data", "sample_events"),
+    "format_currency": ("festival_roi.formatting", "format_currency"),
+    "currency_formatter": ("festival_roi.formatting", "currency_formatter"),
+    "metric_value": ("festival_roi.ranking", "metric_value"),
+    "resolve_metric": ("festival_roi.ranking", "resolve_metric"),
+    "parse_args": ("festival_roi.cli", "parse_args"),
+    "main": ("festival_roi.cli", "main"),
+    "cli_main": ("festival_roi.cli", "main"),
+}
+
+if TYPE_CHECKING:
+    from .analysis import summarize, summarize_below_target, summarize_path
+    from .cli import main as cli_main, parse_args
+    from .formatting import currency_formatter, format_currency
+    from .io import (
+        load_events,
+        load_events_arrow,
+        load_events_columnar,
+        load_events_df,
+    )
+    from .models import FestivalEvent, Summary
+    from .ranking import metric_value, resolve_metric
+    from .reporting import event_as_dict, events_as_dicts, export_report
+    from .sample_data import sample_events
+
+    main = cli_main
 
 __all__ = [
     "FestivalEvent",
+    "Summary",
     "summarize",
+    "summarize_path",
+    "summarize_below_target",
     "load_events",
+    "load_events_arrow",
+    "load_events_columnar",
+    "load_events_df",
     "export_report",
     "event_as_dict",
+    "events_as_dicts",
     "sample_events",
     "format_currency",
+    "currency_formatter",
     "metric_value",
+    "resolve_metric",
     "parse_args",
     "main",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name, attribute = _EXPORTS[name]
+    except KeyError:
+        # Submodules such as ``festival_roi.analysis`` load on first access too.
+        try:
+            return importlib.import_module(f"{__name__}.{name}")
+        except ModuleNotFoundError as exc:
+            if exc.name != f"{__name__}.{name}":
+                raise
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_EXPORTS))
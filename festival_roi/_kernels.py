@@ -0,0 +1,41 @@
+"""Compiled numeric kernels for large datasets.
+
+Numba is an optional dependency. When it is not installed the kernels are
+``None`` and callers fall back to their pure-Python loops.
+"""
+
+from __future__ import annotations
+
+from festival_roi._compat import optional_import
+
+__all__ = ["summarize_kernel"]
+
+_numba = optional_import("numba")
+
+summarize_kernel = None
+
+if _numba is not None:
+    import numpy as np
+
+    @_numba.njit(cache=True)
+    def summarize_kernel(cost, revenue, attendance):  # noqa: F811
+        """Return total profit, cost, ROI and attendance for the given columns."""
+        total_profit = 0.0
+        total_cost = 0.0
+        total_roi = 0.0
+        total_attendance = 0
+        for index in range(cost.shape[0]):
+            profit = revenue[index] - cost[index]
+            total_profit += profit
+            total_cost += cost[index]
+            total_roi += 0.0 if cost[index] == 0 else profit / cost[index]
+            total_attendance += attendance[index]
+        return total_profit, total_cost, total_roi, total_attendance
+
+    # Compile (or load from the on-disk cache) up front so the first large
+    # dataset does not pay the JIT warm-up.
+    summarize_kernel(
+        np.zeros(1, dtype=np.float64),
+        np.zeros(1, dtype=np.float64),
+        np.zeros(1, dtype=np.int64),
+    )
@@ -3,19 +3,34 @@
 from __future__ import annotations
 
 import argparse
+import heapq
+import sys
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
-from festival_roi.analysis import summarize
-from festival_roi.formatting import format_currency
-from festival_roi.io import load_events
-from festival_roi.models import FestivalEvent
-from festival_roi.ranking import metric_value
+from festival_roi._compat import optional_import, worth_bulk_parsing
+from festival_roi.analysis import (
+    column_metrics,
+    summarize,
+    summarize_below_target,
+    summarize_path,
+)
+from festival_roi.formatting import currency_formatter
+from festival_roi.io import events_from_columns, load_events, load_events_columnar
+from festival_roi.models import FestivalEvent, Summary
+from festival_roi.ranking import rank_column_indices, rank_extremes, resolve_metric
 from festival_roi.reporting import export_report
 from festival_roi.sample_data import sample_events
 
 __all__ = ["parse_args", "main"]
 
+# Up to this many events one shared sort beats separate nlargest/nsmallest
+# calls when both ends are shown; past it the heaps win.
+_SHARED_SORT_MAX_EVENTS = 1000
+
+# Summary, top, bottom and underperforming events.
+_Ranked = Tuple[Summary, List[FestivalEvent], List[FestivalEvent], List[FestivalEvent]]
+
 
 def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
     """Build and parse command line arguments."""
@@ -69,46 +84,99 @@ def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
         default="Festival ROI Summary",
         help="Custom title for the printed report header.",
     )
+    parser.add_argument(
+        "--fast",
+        action="store_true",
+        help=(
+            "Parse --input with pyarrow, pandas or NumPy when installed, whatever "
+            "its size (by default only larger files are)."
+        ),
+    )
     parser.add_argument(
         "--roi-target",
         type=float,
         help="ROI threshold (0.25 for 25%%) used to flag underperforming events.",
     )
-    return parser.parse_args(argv)
+    args = parser.parse_args(argv)
+    # Resolve the ranking metric once so every comparison is a plain getter.
+    args.rank_key = resolve_metric(args.rank_by)
+    return args
+
+
+def _use_columnar(path: Path, fast: bool) -> bool:
+    # Small inputs rank just as quickly as events, without importing NumPy.
+    if not fast and not worth_bulk_parsing(path):
+        return False
+    return optional_import("numpy") is not None
+
+
+def _rank_columns(args: argparse.Namespace) -> Optional[_Ranked]:
+    """Summarise and rank ``args.input`` on NumPy columns.
+
+    Only the selected events are built. Returns ``None`` when the file cannot
+    be parsed in bulk so :func:`load_events` can report the offending row.
+    """
+    try:
+        columns = load_events_columnar(
+            args.input, args.min_attendance, use_arrow=True if args.fast else None
+        )
+    except ValueError:
+        return None
+    columns = column_metrics(columns)
+    top, bottom, below = rank_column_indices(
+        columns, args.rank_by, args.top, args.bottom, args.roi_target
+    )
+    top_events = events_from_columns(columns, top)
+    bottom_events = events_from_columns(columns, bottom)
+    underperformers = events_from_columns(columns, below)
+    return summarize(columns), top_events, bottom_events, underperformers
 
 
 def main(argv: Optional[List[str]] = None) -> None:
     """Entry point for the CLI."""
     args = parse_args(argv)
-    currency = args.currency
+    money = currency_formatter(args.currency)
     title = args.report_title
-    events = sample_events()
-    if args.input:
-        events = load_events(args.input)
-    if args.min_attendance > 0:
-        events = [event for event in events if event.attendance >= args.min_attendance]
-    summary = summarize(events)
-    top_count = max(0, min(args.top, len(events)))
-    ranked_desc: List[FestivalEvent] = []
-    if events:
-        ranked_desc = sorted(
-            events, key=lambda event: metric_value(event, args.rank_by), reverse=True
-        )
-    top_events: List[FestivalEvent] = ranked_desc[:top_count]
-    bottom_count = max(0, min(args.bottom, len(events)))
-    bottom_events: List[FestivalEvent] = []
-    if bottom_count:
-        bottom_events = sorted(
-            events, key=lambda event: metric_value(event, args.rank_by)
-        )[:bottom_count]
+    ranked: Optional[_Ranked] = None
+    if args.input and args.summary_only and args.roi_target is None:
+        # Nothing is ranked or listed, so only the totals are needed.
+        summary = summarize_path(args.input, args.min_attendance, args.fast)
+        ranked = summary, [], [], []
+    elif args.input and _use_columnar(args.input, args.fast):
+        ranked = _rank_columns(args)
+    if ranked is not None:
+        summary, top_events, bottom_events, underperformers = ranked
+    else:
+        if args.input:
+            events = load_events(args.input, args.min_attendance)
+        else:
+            events = sample_events()
+            if args.min_attendance > 0:
+                events = [
+                    event
+                    for event in events
+                    if event.attendance >= args.min_attendance
+                ]
+        underperformers = []
+        if args.roi_target is None:
+            summary = summarize(events)
+        else:
+            summary, below = summarize_below_target(events, args.roi_target)
+            underperformers = [events[index] for index in below]
+        top_count = max(0, min(args.top, len(events)))
+        bottom_count = max(0, min(args.bottom, len(events)))
+        bottom_events = []
+        if top_count and bottom_count and len(events) <= _SHARED_SORT_MAX_EVENTS:
+            top_events, bottom_events = rank_extremes(
+                events, args.rank_key, top_count, bottom_count
+            )
+        else:
+            top_events = heapq.nlargest(top_count, events, key=args.rank_key)
+            if bottom_count:
+                bottom_events = heapq.nsmallest(bottom_count, events, key=args.rank_key)
     if args.summary_only:
         top_events = []
         bottom_events = []
-    underperformers: List[FestivalEvent] = []
-    if args.roi_target is not None:
-        underperformers = [
-            event for event in events if event.roi < args.roi_target
-        ]
     if args.export_json:
         export_report(
             args.export_json,
@@ -120,53 +188,50 @@ def main(argv: Optional[List[str]] = None) -> None:
             args.roi_target,
             title,
         )
-    print(title)
-    print("-------------------")
-    print(f"Events analysed : {summary['events']}")
-    print(f"Avg ROI         : {summary['avg_roi']:.2%}")
-    print(f"Avg Profit      : {format_currency(summary['avg_profit'], currency)}")
-    print(f"Total Profit    : {format_currency(summary['total_profit'], currency)}")
-    print(f"Total Attendance: {summary['total_attendance']:,}")
-    print(
-        f"Avg Cost/Guest  : {format_currency(summary['avg_cost_per_attendee'], currency)}"
-    )
-    print()
+    # Collect the report and write it once rather than per print() call.
+    lines: List[str] = []
+    append = lines.append
+    append(title)
+    append("-------------------")
+    append(f"Events analysed : {summary.events}")
+    append(f"Avg ROI         : {summary.avg_roi:.2%}")
+    append(f"Avg Profit      : {money(summary.avg_profit)}")
+    append(f"Total Profit    : {money(summary.total_profit)}")
+    append(f"Total Attendance: {summary.total_attendance:,}")
+    append(f"Avg Cost/Guest  : {money(summary.avg_cost_per_attendee)}")
+    append("")
     if args.roi_target is not None:
-        print(f"Events below ROI target ({args.roi_target:.2%})")
+        append(f"Events below ROI target ({args.roi_target:.2%})")
         if underperformers:
             for event in underperformers:
-                print(
+                append(
                     f"- {event.name}: ROI {event.roi:.2%}, "
-                    f"Profit {format_currency(event.profit, currency)}"
+                    f"Profit {money(event.profit)}"
                 )
         else:
-            print("- None")
-        print()
+            append("- None")
+        append("")
     label = {"roi": "ROI", "profit": "Profit", "attendance": "Attendance"}[
         args.rank_by
     ]
     if top_events:
-        print(f"Top {len(top_events)} Events by {label}")
+        append(f"Top {len(top_events)} Events by {label}")
         for event in top_events:
-            print(
+            append(
                 f"- {event.name}: ROI {event.roi:.2%}, "
-                f"Profit {format_currency(event.profit, currency)}, "
+                f"Profit {money(event.profit)}, "
                 f"Attendance {event.attendance:,}, "
-                f"Cost/Guest {format_currency(event.cost_per_attendee, currency)}"
+                f"Cost/Guest {money(event.cost_per_attendee)}"
             )
-        print()
+        append("")
     if bottom_events:
-        print(f"Bottom {len(bottom_events)} Events by {label}")
+        append(f"Bottom {len(bottom_events)} Events by {label}")
         for event in bottom_events:
-            print(
+            append(
                 f"- {event.name}: ROI {event.roi:.2%}, "
-                f"Profit {format_currency(event.profit, currency)}, "
+                f"Profit {money(event.profit)}, "
                 f"Attendance {event.attendance:,}, "
-                f"Cost/Guest {format_currency(event.cost_per_attendee, currency)}"
+                f"Cost/Guest {money(event.cost_per_attendee)}"
             )
-        print()
-    if args.summary_only:
-        return
-    if not top_events and not bottom_events:
-        return
-
+        append("")
+    sys.stdout.write("\n".join(lines) + "\n")
@@ -2,11 +2,28 @@
 
 from __future__ import annotations
 
-__all__ = ["format_currency"]
+from typing import Callable
+
+__all__ = ["currency_formatter", "format_currency"]
+
+# Bound str.format methods, picked by symbol length: single-character symbols
+# ("$") sit flush against the amount, longer prefixes ("EUR") get a space.
+_FORMAT_FLUSH = "{0}{1:,.2f}".format
+_FORMAT_SPACED = "{0} {1:,.2f}".format
 
 
 def format_currency(value: float, symbol: str) -> str:
     """Format a numeric value as a currency string."""
-    spacer = "" if len(symbol) == 1 else " "
-    return f"{symbol}{spacer}{value:,.2f}"
+    return (_FORMAT_FLUSH if len(symbol) == 1 else _FORMAT_SPACED)(symbol, value)
 
+
+def currency_formatter(symbol: str) -> Callable[[float], str]:
+    """Return a one-argument equivalent of ``format_currency(value, symbol)``.
+
+    The spacing is decided once, which suits formatting many amounts with the
+    same symbol.
+    """
+    spacer = "" if len(symbol) == 1 else " "
+    # Double any braces so the symbol is not read as a replacement field.
+    prefix = symbol.replace("{", "{{").replace("}", "}}")
+    return (prefix + spacer + "{:,.2f}").format
@@ -3,35 +3,277 @@
 from __future__ import annotations
 
 import csv
+import warnings
 from pathlib import Path
-from typing import List
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Sequence, TextIO
 
+from festival_roi._compat import ARROW_MIN_BYTES, optional_import, worth_bulk_parsing
 from festival_roi.models import FestivalEvent
 
-__all__ = ["load_events"]
+if TYPE_CHECKING:
+    import pandas
+    import pyarrow
 
+__all__ = [
+    "events_from_columns",
+    "load_events",
+    "load_events_arrow",
+    "load_events_columnar",
+    "load_events_df",
+    "read_event_columns",
+    "read_event_rows",
+]
 
-def load_events(csv_path: Path) -> List[FestivalEvent]:
-    """Load festival events from a CSV file."""
-    rows: List[FestivalEvent] = []
+REQUIRED_COLUMNS = ("name", "cost", "revenue", "attendance")
+
+# Column layout for the NumPy parser; plain tuples keep NumPy optional.
+_COLUMN_FIELDS = (
+    ("name", object),
+    ("cost", "f8"),
+    ("revenue", "f8"),
+    ("attendance", "i8"),
+)
+# Attendance is read as text and converted with int(): pandas' int64 parser
+# also accepts values such as "12.0" or "1e3", which the csv loader rejects.
+_FRAME_DTYPES = {
+    "name": str,
+    "cost": "float64",
+    "revenue": "float64",
+    "attendance": str,
+}
+
+
+def _column_positions(header: Sequence[str]) -> Dict[str, int]:
+    """Map each header column to its index, checking the required ones exist.
+
+    A required column listed twice is rejected: the parsers do not agree on
+    which of the two they would read.
+    """
+    positions = {column: index for index, column in enumerate(header)}
+    missing = set(REQUIRED_COLUMNS) - positions.keys()
+    if missing:
+        pretty = ", ".join(sorted(missing))
+        raise ValueError(f"CSV missing required columns: {pretty}")
+    duplicated = {column for column in REQUIRED_COLUMNS if header.count(column) > 1}
+    if duplicated:
+        pretty = ", ".join(sorted(duplicated))
+        raise ValueError(f"CSV has duplicate columns: {pretty}")
+    return positions
+
+
+def _check_header(csv_path: Path) -> None:
+    # Read with the csv module so every parser sees the same header (pandas
+    # would strip a UTF-8 BOM, for one).
     with csv_path.open(newline="", encoding="utf-8") as handle:
-        reader = csv.DictReader(handle)
-        required = {"name", "cost", "revenue", "attendance"}
-        missing = required - set(reader.fieldnames or [])
-        if missing:
-            pretty = ", ".join(sorted(missing))
-            raise ValueError(f"CSV missing required columns: {pretty}")
-        for raw in reader:
-            try:
-                rows.append(
-                    FestivalEvent(
-                        name=raw["name"],
-                        cost=float(raw["cost"]),
-                        revenue=float(raw["revenue"]),
-                        attendance=int(raw["attendance"]),
-                    )
+        _column_positions(next(csv.reader([handle.readline()]), []))
+
+
+def load_events(csv_path: Path, min_attendance: int = 0) -> List[FestivalEvent]:
+    """Load festival events from a CSV file.
+
+    Rows with attendance below ``min_attendance`` are skipped while reading.
+    """
+    with csv_path.open(newline="", encoding="utf-8") as handle:
+        return read_event_rows(handle, min_attendance)
+
+
+def load_events_df(csv_path: Path, min_attendance: int = 0) -> pandas.DataFrame:
+    """Load festival events into a DataFrame with typed, validated columns.
+
+    The columns are ``name``, ``cost``, ``revenue`` and ``attendance``, in that
+    order; rows with attendance below ``min_attendance`` are dropped. Requires
+    pandas.
+    """
+    import pandas as pd
+
+    _check_header(csv_path)
+    frame = pd.read_csv(
+        csv_path,
+        usecols=list(REQUIRED_COLUMNS),
+        dtype=_FRAME_DTYPES,
+        encoding="utf-8",
+        # Names such as "NA" stay strings, as they do with the csv module.
+        keep_default_na=False,
+        # Parse floats exactly as float() does.
+        float_precision="round_trip",
+    )
+    try:
+        frame["attendance"] = frame["attendance"].map(int).astype("int64")
+    except (OverflowError, ValueError) as exc:
+        raise ValueError(f"Invalid CSV data: {exc}") from exc
+    if min_attendance > 0:
+        frame = frame[frame["attendance"] >= min_attendance]
+    return frame[list(REQUIRED_COLUMNS)]
+
+
+def read_event_rows(handle: TextIO, min_attendance: int = 0) -> List[FestivalEvent]:
+    """Parse CSV text from ``handle`` into events, one row at a time.
+
+    Rows with attendance below ``min_attendance`` are skipped. The first row
+    that does not parse is reported in the ``ValueError``.
+    """
+    reader = csv.reader(handle)
+    header = next(reader, [])
+    positions = _column_positions(header)
+    name_at = positions["name"]
+    cost_at = positions["cost"]
+    revenue_at = positions["revenue"]
+    attendance_at = positions["attendance"]
+    rows: List[FestivalEvent] = []
+    for row in reader:
+        if not row:
+            continue  # DictReader skipped blank lines too.
+        try:
+            attendance = int(row[attendance_at])
+            if min_attendance > 0 and attendance < min_attendance:
+                continue
+            rows.append(
+                FestivalEvent(
+                    row[name_at],
+                    float(row[cost_at]),
+                    float(row[revenue_at]),
+                    attendance,
                 )
-            except (TypeError, ValueError) as exc:
-                raise ValueError(f"Invalid row {raw}") from exc
+            )
+        except (IndexError, TypeError, ValueError) as exc:
+            raise ValueError(f"Invalid row {dict(zip(header, row))}") from exc
     return rows
 
+
+def load_events_arrow(csv_path: Path) -> pyarrow.Table:
+    """Load festival events into an Arrow table with pyarrow's CSV reader.
+
+    The columns are ``name``, ``cost``, ``revenue`` and ``attendance``, in that
+    order. Requires pyarrow.
+    """
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+
+    _check_header(csv_path)
+    try:
+        # Numbers are read as text and converted below: Arrow's own parsers also
+        # accept hex attendance ("0x10") and NaN payloads ("nan(1)").
+        table = pa_csv.read_csv(
+            csv_path,
+            read_options=pa_csv.ReadOptions(block_size=1 << 22),
+            convert_options=pa_csv.ConvertOptions(
+                column_types={name: pa.string() for name in REQUIRED_COLUMNS},
+                include_columns=list(REQUIRED_COLUMNS),
+                # Empty or "NA" fields are errors, as they are for float().
+                null_values=[],
+                strings_can_be_null=False,
+            ),
+        )
+        return pa.table(
+            {
+                "name": table.column("name"),
+                "cost": _arrow_amounts(table.column("cost")),
+                "revenue": _arrow_amounts(table.column("revenue")),
+                "attendance": _arrow_counts(table.column("attendance")),
+            }
+        )
+    except pa.ArrowInvalid as exc:
+        raise ValueError(f"Invalid CSV data: {exc}") from exc
+
+
+def _arrow_amounts(text: Any) -> Any:
+    """Cast a string column to float64, accepting only what float() accepts."""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    values = pc.cast(text, pa.float64())
+    # The cast matches float() except that it also reads NaN payloads.
+    for raw in pc.filter(text, pc.is_nan(values)).to_pylist():
+        if raw.strip().lstrip("+-").lower() != "nan":
+            raise pa.ArrowInvalid(f"Failed to parse {raw!r} as a number")
+    return values
+
+
+def _arrow_counts(text: Any) -> Any:
+    """Cast a string column to int64, accepting plain decimal integers only."""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    # Anything else int() would take (underscores, non-ASCII digits) is left to
+    # the NumPy and csv parsers, which then report or accept it.
+    plain = pc.match_substring_regex(text, r"^\s*-?[0-9]+\s*$")
+    if not pc.all(plain, min_count=0).as_py():
+        raise pa.ArrowInvalid("Attendance values must be whole numbers")
+    return pc.cast(pc.utf8_trim_whitespace(text), pa.int64())
+
+
+def load_events_columnar(
+    csv_path: Path, min_attendance: int = 0, use_arrow: bool | None = None
+) -> Dict[str, Any]:
+    """Load festival events from a CSV file as NumPy columns.
+
+    Returns ``name``, ``cost``, ``revenue`` and ``attendance`` arrays without
+    building a FestivalEvent per row, leaving out rows with attendance below
+    ``min_attendance``. Requires NumPy.
+
+    Files of :data:`~festival_roi._compat.ARROW_MIN_BYTES` or more are parsed
+    with :func:`load_events_arrow` when pyarrow is installed; ``use_arrow``
+    forces that choice either way.
+    """
+    if use_arrow is None:
+        use_arrow = worth_bulk_parsing(csv_path, ARROW_MIN_BYTES)
+    columns = None
+    if use_arrow and optional_import("pyarrow") is not None:
+        try:
+            table = load_events_arrow(csv_path)
+        except ValueError:
+            pass  # The NumPy parser below decides whether the file is valid.
+        else:
+            columns = {
+                name: table.column(name).to_numpy(zero_copy_only=False)
+                for name in REQUIRED_COLUMNS
+            }
+    if columns is None:
+        with csv_path.open(newline="", encoding="utf-8") as handle:
+            columns = read_event_columns(handle)
+    if min_attendance > 0:
+        keep = columns["attendance"] >= min_attendance
+        columns = {name: values[keep] for name, values in columns.items()}
+    return columns
+
+
+def read_event_columns(handle: TextIO) -> Dict[str, Any]:
+    """Parse CSV text from ``handle`` into NumPy columns in one ``loadtxt`` call."""
+    import numpy as np
+
+    positions = _column_positions(next(csv.reader([handle.readline()]), []))
+    with warnings.catch_warnings():
+        # A header with no rows is valid, just empty.
+        warnings.simplefilter("ignore", UserWarning)
+        try:
+            table = np.loadtxt(
+                handle,
+                dtype=np.dtype(list(_COLUMN_FIELDS)),
+                delimiter=",",
+                quotechar='"',
+                comments=None,
+                usecols=[positions[name] for name, _ in _COLUMN_FIELDS],
+                ndmin=1,
+            )
+        except ValueError as exc:
+            raise ValueError(f"Invalid CSV data: {exc}") from exc
+    return {name: np.ascontiguousarray(table[name]) for name, _ in _COLUMN_FIELDS}
+
+
+def events_from_columns(
+    columns: Mapping[str, Any], indices: Any
+) -> List[FestivalEvent]:
+    """Build FestivalEvent instances for the given rows of ``columns``."""
+    names = columns["name"]
+    cost = columns["cost"]
+    revenue = columns["revenue"]
+    attendance = columns["attendance"]
+    return [
+        FestivalEvent(
+            names[index],
+            float(cost[index]),
+            float(revenue[index]),
+            int(attendance[index]),
+        )
+        for index in indices.tolist()
+    ]
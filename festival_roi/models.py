@@ -2,34 +2,90 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from typing import Any, NamedTuple, Tuple
 
-__all__ = ["FestivalEvent"]
+__all__ = ["FestivalEvent", "Summary"]
+
+_set_slot = object.__setattr__
 
 
-@dataclass
 class FestivalEvent:
-    """Represents a single festival event and derived financial metrics."""
+    """Represents a single festival event and derived financial metrics.
+
+    ``roi``, ``profit`` and ``cost_per_attendee`` are computed once at
+    construction and stored alongside the raw figures. Events are immutable
+    and compare, hash and print by their four input fields, as the frozen
+    dataclass this replaces did.
+    """
+
+    __slots__ = (
+        "name",
+        "cost",
+        "revenue",
+        "attendance",
+        "roi",
+        "profit",
+        "cost_per_attendee",
+    )
+    __match_args__ = ("name", "cost", "revenue", "attendance")
 
     name: str
     cost: float
     revenue: float
     attendance: int
+    roi: float
+    profit: float
+    cost_per_attendee: float
+
+    def __init__(
+        self, name: str, cost: float, revenue: float, attendance: int
+    ) -> None:
+        _set_slot(self, "name", name)
+        _set_slot(self, "cost", cost)
+        _set_slot(self, "revenue", revenue)
+        _set_slot(self, "attendance", attendance)
+        profit = revenue - cost
+        _set_slot(self, "profit", profit)
+        # ROI is (revenue - cost) / cost, guarded against division by zero.
+        _set_slot(self, "roi", profit / cost if cost != 0 else 0.0)
+        _set_slot(
+            self, "cost_per_attendee", cost / attendance if attendance != 0 else 0.0
+        )
+
+    def _key(self) -> Tuple[str, float, float, int]:
+        return (self.name, self.cost, self.revenue, self.attendance)
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__qualname__}(name={self.name!r}, cost={self.cost!r}, "
+            f"revenue={self.revenue!r}, attendance={self.attendance!r})"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is self.__class__:
+            return self._key() == other._key()  # type: ignore[attr-defined]
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self._key())
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"cannot assign to field {name!r}")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"cannot delete field {name!r}")
 
-    @property
-    def roi(self) -> float:
-        """Return ROI as (revenue - cost) / cost, guarded against division by zero."""
-        if self.cost == 0:
-            return 0.0
-        return (self.revenue - self.cost) / self.cost
+    def __reduce__(self) -> Tuple[type, Tuple[str, float, float, int]]:
+        # Rebuild through __init__; slot-by-slot unpickling would hit __setattr__.
+        return (self.__class__, self._key())
 
-    @property
-    def profit(self) -> float:
-        return self.revenue - self.cost
 
-    @property
-    def cost_per_attendee(self) -> float:
-        if self.attendance == 0:
-            return 0.0
-        return self.cost / self.attendance
+class Summary(NamedTuple):
+    """Aggregate metrics for a collection of festival events."""
 
+    events: int
+    avg_roi: float
+    avg_profit: float
+    total_profit: float
+    total_attendance: int
+    avg_cost_per_attendee: float
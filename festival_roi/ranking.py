@@ -2,16 +2,113 @@
 
 from __future__ import annotations
 
+from operator import attrgetter
+from typing import Any, Callable, List, Mapping, Optional, Sequence, Tuple
+
 from festival_roi.models import FestivalEvent
 
-__all__ = ["metric_value"]
+__all__ = [
+    "metric_value",
+    "rank_column_indices",
+    "rank_extremes",
+    "resolve_metric",
+    "top_indices",
+]
+
+MetricGetter = Callable[[FestivalEvent], float]
+
+# Plain attribute getters: sorting on the int attendance orders events exactly
+# as the float values from metric_value would, without a Python-level call.
+_METRIC_GETTERS: dict[str, MetricGetter] = {
+    "profit": attrgetter("profit"),
+    "attendance": attrgetter("attendance"),
+    "roi": attrgetter("roi"),
+}
+
+
+def resolve_metric(metric: str) -> MetricGetter:
+    """Return a key function for ``metric``, defaulting to ROI.
+
+    Resolve once and reuse it as a sort key instead of calling
+    :func:`metric_value` per comparison.
+    """
+    return _METRIC_GETTERS.get(metric, _METRIC_GETTERS["roi"])
 
 
 def metric_value(event: FestivalEvent, metric: str) -> float:
     """Return a value suitable for ranking events."""
-    if metric == "profit":
-        return event.profit
     if metric == "attendance":
         return float(event.attendance)
-    return event.roi
+    return resolve_metric(metric)(event)
+
+
+def rank_extremes(
+    events: Sequence[FestivalEvent], key: MetricGetter, top: int, bottom: int
+) -> Tuple[List[FestivalEvent], List[FestivalEvent]]:
+    """Return the ``top`` highest and ``bottom`` lowest events from one sort.
+
+    Matches ``heapq.nlargest``/``heapq.nsmallest`` with the same ``key``,
+    including the input order of ties; use those when only one end is needed.
+    """
+    ranked = sorted(events, key=key)
+    bottom_events = ranked[: max(0, bottom)]
+    top = max(0, min(top, len(ranked)))
+    if not top:
+        return [], bottom_events
+    # Read the top off the end, widened to the whole tie group at the cut so
+    # the earliest of the tied events are kept, as nlargest does.
+    start = len(ranked) - top
+    boundary = key(ranked[start])
+    while start and key(ranked[start - 1]) == boundary:
+        start -= 1
+    top_events = sorted(ranked[start:], key=key, reverse=True)[:top]
+    return top_events, bottom_events
+
+
+def top_indices(values: Any, count: int) -> Any:
+    """Return indices of the ``count`` largest ``values`` (a NumPy array).
+
+    Selects in O(N) with ``argpartition`` and sorts only the candidates. Ties
+    keep input order, matching ``sorted(..., reverse=True)[:count]``; pass
+    ``-values`` for the smallest. Requires NumPy.
+    """
+    import numpy as np
+
+    count = max(0, min(count, values.size))
+    if count == 0:
+        return np.empty(0, dtype=np.intp)
+    candidates = np.arange(values.size)
+    if count < values.size:
+        # Partition to find the cut-off, then keep every tie so the stable sort
+        # below picks the same events as ``sorted`` would.
+        cutoff = values[np.argpartition(-values, count - 1)[count - 1]]
+        candidates = np.flatnonzero(values >= cutoff)
+    order = np.argsort(-values[candidates], kind="stable")
+    return candidates[order[:count]]
+
+
+def rank_column_indices(
+    columns: Mapping[str, Any],
+    rank_by: str,
+    top: int,
+    bottom: int,
+    roi_target: Optional[float] = None,
+) -> Tuple[Any, Any, Any]:
+    """Return top, bottom and below-``roi_target`` row indices into ``columns``.
+
+    ``columns`` carries the ``roi``, ``profit`` and ``attendance`` arrays from
+    :func:`festival_roi.analysis.column_metrics`; ``rank_by`` defaults to ROI
+    like :func:`resolve_metric`. Requires NumPy.
+    """
+    import numpy as np
 
+    metric = {"profit": columns["profit"], "attendance": columns["attendance"]}.get(
+        rank_by, columns["roi"]
+    )
+    empty = np.empty(0, dtype=np.intp)
+    top_selection = top_indices(metric, top)
+    bottom_selection = top_indices(-metric, bottom) if bottom > 0 else empty
+    under_selection = empty
+    if roi_target is not None:
+        under_selection = np.flatnonzero(columns["roi"] < roi_target)
+    return top_selection, bottom_selection, under_selection
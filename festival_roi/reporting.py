@@ -2,31 +2,46 @@
 
 from __future__ import annotations
 
-import json
+import math
+from operator import attrgetter
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import Iterable, List, Optional
 
-from festival_roi.models import FestivalEvent
+from festival_roi._compat import optional_import
+from festival_roi.models import FestivalEvent, Summary
 
-__all__ = ["event_as_dict", "export_report"]
+__all__ = ["event_as_dict", "events_as_dicts", "export_report"]
+
+_EVENT_KEYS = (
+    "name",
+    "cost",
+    "revenue",
+    "attendance",
+    "roi",
+    "profit",
+    "cost_per_attendee",
+)
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Reads every field in one C-level call, returning them in _EVENT_KEYS order.
+_event_values = attrgetter(*_EVENT_KEYS)
 
 
 def event_as_dict(event: FestivalEvent) -> dict:
     """Return a serializable representation of an event."""
-    return {
-        "name": event.name,
-        "cost": event.cost,
-        "revenue": event.revenue,
-        "attendance": event.attendance,
-        "roi": event.roi,
-        "profit": event.profit,
-        "cost_per_attendee": event.cost_per_attendee,
-    }
+    return dict(zip(_EVENT_KEYS, _event_values(event)))
+
+
+def events_as_dicts(events: Iterable[FestivalEvent]) -> List[dict]:
+    """Return :func:`event_as_dict` for each event."""
+    keys = _EVENT_KEYS
+    values = _event_values
+    return [dict(zip(keys, values(event))) for event in events]
 
 
 def export_report(
     path: Path,
-    summary: dict,
+    summary: Summary,
     top_events: Iterable[FestivalEvent],
     metric: str,
     bottom_events: Iterable[FestivalEvent],
@@ -37,16 +52,41 @@ def export_report(
     """Persist the analysis results as a JSON document."""
     payload = {
         "title": title,
-        "summary": summary,
+        "summary": summary._asdict(),
         "ranking_metric": metric,
-        "top_events": [event_as_dict(event) for event in top_events],
-        "bottom_events": [event_as_dict(event) for event in bottom_events],
+        "top_events": events_as_dicts(top_events),
+        "bottom_events": events_as_dicts(bottom_events),
         "roi_target": roi_target,
-        "underperforming_events": [
-            event_as_dict(event) for event in underperformers
-        ],
+        "underperforming_events": events_as_dicts(underperformers),
     }
     if path.parent and not path.parent.exists():
         path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    orjson = optional_import("orjson")
+    # orjson would write NaN and infinities as null; json keeps them.
+    if orjson is not None and _all_finite(payload):
+        try:
+            encoded = orjson.dumps(
+                payload, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+            )
+        except orjson.JSONEncodeError:  # e.g. integers wider than 64 bits
+            pass
+        else:
+            with path.open("wb") as handle:
+                handle.write(encoded)
+            return
+    import json
+
+    # json.dump encodes in chunks; a large buffer turns them into few writes.
+    with path.open("w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE) as handle:
+        json.dump(payload, handle, indent=2)
+
 
+def _all_finite(value: object) -> bool:
+    """Return whether every float nested in ``value`` is finite."""
+    if isinstance(value, float):
+        return math.isfinite(value)
+    if isinstance(value, dict):
+        return all(map(_all_finite, value.values()))
+    if isinstance(value, list):
+        return all(map(_all_finite, value))
+    return True
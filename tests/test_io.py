@@ -0,0 +1,138 @@
+"""The bulk CSV parsers must accept and reject exactly what the csv loader does."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from festival_roi import io
+
+ATTENDANCE_VALUES = [
+    "12",
+    " 12 ",
+    "+5",
+    "-3",
+    "0012",
+    "1_000",
+    "100000000000000000000",
+    "12.0",
+    "1e3",
+    "1.",
+    "1E2",
+    "0012.000",
+    "0x10",
+    "nan",
+    "NA",
+    "",
+]
+MONEY_VALUES = [
+    "1.5",
+    " 2.5 ",
+    "+.5",
+    "1e5",
+    "0012",
+    "1_000",
+    "inf",
+    "-Infinity",
+    "nan",
+    "nan(1)",
+    "0x10",
+    "1d5",
+    "1.5e",
+    "NA",
+    "",
+]
+
+
+def _outcome(load, path: Path) -> str:
+    # Compared as text so NaN fields count as equal.
+    try:
+        return repr(
+            [
+                (event.name, event.cost, event.revenue, event.attendance)
+                for event in load(path)
+            ]
+        )
+    except ValueError as exc:
+        return str(exc)
+
+
+def _write(path: Path, cost: str = "10", attendance: str = "5") -> Path:
+    path.write_text(
+        "name,cost,revenue,attendance\n"
+        "Spring,100,150,40\n"
+        f"Odd,{cost},20,{attendance}\n",
+        encoding="utf-8",
+    )
+    return path
+
+
+def _read_rows(path: Path):
+    with path.open(newline="", encoding="utf-8") as handle:
+        return io.read_event_rows(handle)
+
+
+def _columnar_outcome(load, path: Path) -> str:
+    import numpy as np
+
+    try:
+        columns = load(path)
+    except ValueError:
+        return "rejected"
+    indices = np.arange(len(columns["name"]))
+    return _outcome(lambda _: io.events_from_columns(columns, indices), path)
+
+
+def _frame_columns(path: Path):
+    frame = io.load_events_df(path)
+    return {column: frame[column].to_numpy() for column in frame.columns}
+
+
+def _column_loaders():
+    return {
+        "pandas": _frame_columns,
+        "arrow": lambda path: io.load_events_columnar(path, use_arrow=True),
+        "loadtxt": lambda path: io.load_events_columnar(path, use_arrow=False),
+    }
+
+
+@pytest.mark.parametrize("loader", ["arrow", "loadtxt", "pandas"])
+@pytest.mark.parametrize(
+    "cost, attendance",
+    [(cost, "5") for cost in MONEY_VALUES] + [("10", att) for att in ATTENDANCE_VALUES],
+)
+def test_column_loaders_accept_only_valid_rows(tmp_path, loader, cost, attendance):
+    pytest.importorskip("numpy")
+    module = {"arrow": "pyarrow", "pandas": "pandas"}.get(loader)
+    if module is not None:
+        pytest.importorskip(module)
+    path = _write(tmp_path / "events.csv", cost=cost, attendance=attendance)
+    # A bulk parser may reject more than the csv loader (the caller then falls
+    # back to it), but anything it accepts must load to the same events.
+    outcome = _columnar_outcome(_column_loaders()[loader], path)
+    if outcome != "rejected":
+        assert outcome == _outcome(_read_rows, path)
+
+
+BAD_HEADERS = {
+    # pandas strips the BOM; the csv module, like the baseline loader, does not.
+    "bom": "\ufeffname,cost,revenue,attendance\nSpring,100,150,40\n",
+    "duplicate": "name,cost,revenue,attendance,cost\nSpring,100,150,40,7\n",
+}
+
+
+@pytest.mark.parametrize("loader", ["rows", "loadtxt", "pandas", "arrow"])
+@pytest.mark.parametrize("header", sorted(BAD_HEADERS))
+def test_loaders_reject_bad_headers(tmp_path, loader, header):
+    if loader != "rows":
+        pytest.importorskip("numpy")
+    module = {"arrow": "pyarrow", "pandas": "pandas"}.get(loader)
+    if module is not None:
+        pytest.importorskip(module)
+    path = tmp_path / "events.csv"
+    path.write_text(BAD_HEADERS[header], encoding="utf-8")
+    # Arrow on its own: load_events_columnar would fall back to loadtxt.
+    load = dict(_column_loaders(), rows=_read_rows, arrow=io.load_events_arrow)[loader]
+    with pytest.raises(ValueError, match="CSV (missing required|has duplicate)"):
+        load(path)